@@ -1,15 +1,56 @@
 """Enhanced Chrome client with network monitoring from undetected-chrome-mcp."""
 
 import asyncio
+import collections
+import concurrent.futures
 import json
 import logging
+import re
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from .chrome_client import ChromeClient
 
 logger = logging.getLogger(__name__)
 
+# orjson parses large JSON payloads several times faster than the stdlib;
+# fall back to json when it isn't installed (optional dependency)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Precompiled pattern for RSC payload extraction - compiled once at import
+# instead of per response body
+_DESC_RE = re.compile(r'"description","content":"([^"]*)"')
+
+# Single decoder instance for slicing JSON arrays out of RSC payloads
+_JSON_DECODER = json.JSONDecoder()
+
+# Sentinel pushed onto the raw event queue to stop the drain thread
+_DRAIN_STOP = object()
+
+
+def _extract_json_after(body: str, key: str) -> Optional[Any]:
+    """Parse the JSON array following '"<key>":' in body, if present.
+
+    Unlike a nongreedy regex capture, raw_decode tracks bracket nesting
+    correctly and scans only the array itself - no backtracking over the
+    rest of the payload.
+    """
+    idx = body.find(f'"{key}":')
+    if idx < 0:
+        return None
+    idx = body.find('[', idx)
+    if idx < 0:
+        return None
+    try:
+        value, _ = _JSON_DECODER.raw_decode(body, idx)
+    except json.JSONDecodeError:
+        return None
+    return value
+
 
 class EnhancedChromeClient(ChromeClient):
     """Chrome client enhanced with network monitoring for capturing GraphQL responses."""
@@ -18,92 +59,225 @@ class EnhancedChromeClient(ChromeClient):
         super().__init__()
         # Network monitoring state (copied from undetected-chrome-mcp)
         self.network_monitoring = False
-        self.network_requests: List[Dict[str, Any]] = []
-        self.network_responses: List[Dict[str, Any]] = []
-        self.network_lock = threading.Lock()
         self.max_network_entries = 1000
-        
+        # Preallocated rings: every slot dict is created once here and
+        # overwritten in place as events roll around, so steady-state capture
+        # allocates no new dicts at all. _head is the next slot to write,
+        # _count how many slots hold live entries (saturates at the ring size).
+        self._req_ring: List[Dict[str, Any]] = [dict() for _ in range(self.max_network_entries)]
+        self._req_head = 0
+        self._req_count = 0
+        self._resp_ring: List[Dict[str, Any]] = [dict() for _ in range(self.max_network_entries)]
+        self._resp_head = 0
+        self._resp_count = 0
+        # Guards slot writes against snapshot reads - a getter copying a slot
+        # mid-overwrite would see a torn entry
+        self.network_lock = threading.Lock()
+        # Raw CDP messages are queued by the handlers and parsed off-thread so
+        # the driver's event dispatch thread only pays for a deque append
+        self._raw_req_queue: Deque[Any] = collections.deque()
+        self._raw_resp_queue: Deque[Any] = collections.deque()
+        self._drain_event = threading.Event()
+        self._drain_thread: Optional[threading.Thread] = None
+        # Set (threadsafe) by the response parser once API/GraphQL traffic
+        # has been captured, so assessments wait on readiness instead of a
+        # fixed sleep; created alongside the loop in start_network_monitoring
+        self._graphql_ready: Optional[asyncio.Event] = None
+        # Running loop, cached on first async entry - get_running_loop is
+        # cheaper than get_event_loop and skips the policy lookup
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Dedicated bounded pool for CDP offloads - keeps blocking DevTools
+        # calls off both the event loop and the shared default executor
+        self._cdp_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="cdp"
+        )
+        # LRU cache of fetched bodies - the RSC and GraphQL extractors can
+        # request the same requestId twice, and each fetch serializes the
+        # full body over the DevTools socket
+        self._body_cache: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._body_cache_max = 256
+
         logger.info("Enhanced Chrome client initialized with network monitoring")
-    
+
     def _network_request_handler(self, message):
-        """Handle Network.requestWillBeSent events."""
+        """Handle Network.requestWillBeSent events (runs on the CDP dispatch thread)."""
+        self._raw_req_queue.append(message)
+        self._drain_event.set()
+
+    def _network_response_handler(self, message):
+        """Handle Network.responseReceived events (runs on the CDP dispatch thread)."""
+        self._raw_resp_queue.append(message)
+        self._drain_event.set()
+
+    def _drain_network_events(self):
+        """Drain and parse queued CDP messages on a dedicated daemon thread."""
+        while True:
+            self._drain_event.wait()
+            self._drain_event.clear()
+            while self._raw_req_queue:
+                message = self._raw_req_queue.popleft()
+                if message is _DRAIN_STOP:
+                    logger.info("Network event drain thread stopping")
+                    return
+                self._parse_request_message(message)
+            while self._raw_resp_queue:
+                self._parse_response_message(self._raw_resp_queue.popleft())
+
+    def _parse_request_message(self, message):
+        """Sniff the request message schema once and install the matching parser.
+
+        undetected-chromedriver delivers every message of a session in the
+        same shape, so the format dispatch only needs to run for the first
+        event; afterwards the drain thread calls the specialized parser
+        directly with no isinstance check.
+        """
+        if isinstance(message, dict) and 'params' in message:
+            self._parse_request_message = self._parse_request_cdp
+        else:
+            self._parse_request_message = self._parse_request_direct
+        self._parse_request_message(message)
+
+    def _parse_request_cdp(self, message):
+        """Parse a standard CDP format Network.requestWillBeSent message."""
         try:
             # Debug: Log to stderr only for MCP compatibility
-            logger.error(f"CDP Network Request Event: {message}")
-            
+            logger.debug("CDP Network Request Event: %s", message)
+
+            params = message['params']
+            # Bind the nested dict once instead of building a throwaway {}
+            # per missing field on every event
+            req = params.get('request') or {}
+            # Overwrite the next ring slot in place - no per-event dict
             with self.network_lock:
-                if len(self.network_requests) >= self.max_network_entries:
-                    self.network_requests.pop(0)  # Remove oldest
-                
-                # Handle different message structures (exact copy from working undetected-chrome-mcp)
-                if isinstance(message, dict) and 'params' in message:
-                    # Standard CDP format
-                    params = message['params']
-                    request_data = {
-                        'requestId': params.get('requestId'),
-                        'url': params.get('request', {}).get('url'),
-                        'method': params.get('request', {}).get('method'),
-                        'headers': params.get('request', {}).get('headers', {}),
-                        'timestamp': params.get('timestamp'),
-                        'type': params.get('type'),
-                        'postData': params.get('request', {}).get('postData')
-                    }
-                else:
-                    # Direct format (undetected-chromedriver specific)
-                    request_data = {
-                        'requestId': message.get('requestId'),
-                        'url': message.get('request', {}).get('url') if message.get('request') else message.get('url'),
-                        'method': message.get('request', {}).get('method') if message.get('request') else message.get('method'),
-                        'headers': message.get('request', {}).get('headers', {}) if message.get('request') else message.get('headers', {}),
-                        'timestamp': message.get('timestamp'),
-                        'type': message.get('type'),
-                        'postData': message.get('request', {}).get('postData') if message.get('request') else message.get('postData')
-                    }
-                
-                self.network_requests.append(request_data)
-                logger.error(f"✅ Network request captured: {request_data.get('method')} {request_data.get('url')}")
+                slot = self._req_ring[self._req_head]
+                slot.clear()
+                slot['requestId'] = params.get('requestId')
+                slot['url'] = req.get('url')
+                slot['method'] = req.get('method')
+                slot['headers'] = req.get('headers', {})
+                slot['timestamp'] = params.get('timestamp')
+                slot['type'] = params.get('type')
+                slot['postData'] = req.get('postData')
+                self._req_head = (self._req_head + 1) % self.max_network_entries
+                if self._req_count < self.max_network_entries:
+                    self._req_count += 1
+            logger.debug("✅ Network request captured: %s %s", req.get('method'), req.get('url'))
         except Exception as e:
             logger.error(f"Error handling network request: {e}")
-    
-    def _network_response_handler(self, message):
-        """Handle Network.responseReceived events."""
+
+    def _parse_request_direct(self, message):
+        """Parse a direct format (undetected-chromedriver specific) request message."""
         try:
             # Debug: Log to stderr only for MCP compatibility
-            logger.error(f"CDP Network Response Event: {message}")
-            
+            logger.debug("CDP Network Request Event: %s", message)
+
+            # Bind the nested dict once; fall back to top-level fields when
+            # the message carries no 'request' payload
+            req = message.get('request') or message
+            # Overwrite the next ring slot in place - no per-event dict
             with self.network_lock:
-                if len(self.network_responses) >= self.max_network_entries:
-                    self.network_responses.pop(0)  # Remove oldest
-                
-                # Handle different message structures (exact copy from working undetected-chrome-mcp)
-                if isinstance(message, dict) and 'params' in message:
-                    # Standard CDP format
-                    params = message['params']
-                    response_data = {
-                        'requestId': params.get('requestId'),
-                        'url': params.get('response', {}).get('url'),
-                        'status': params.get('response', {}).get('status'),
-                        'statusText': params.get('response', {}).get('statusText'),
-                        'headers': params.get('response', {}).get('headers', {}),
-                        'mimeType': params.get('response', {}).get('mimeType'),
-                        'timestamp': params.get('timestamp'),
-                        'type': params.get('type')
-                    }
-                else:
-                    # Direct format (undetected-chromedriver specific)
-                    response_data = {
-                        'requestId': message.get('requestId'),
-                        'url': message.get('response', {}).get('url') if message.get('response') else message.get('url'),
-                        'status': message.get('response', {}).get('status') if message.get('response') else message.get('status'),
-                        'statusText': message.get('response', {}).get('statusText') if message.get('response') else message.get('statusText'),
-                        'headers': message.get('response', {}).get('headers', {}) if message.get('response') else message.get('headers', {}),
-                        'mimeType': params.get('response', {}).get('mimeType') if message.get('response') else message.get('mimeType'),
-                        'timestamp': message.get('timestamp'),
-                        'type': message.get('type')
-                    }
-                
-                self.network_responses.append(response_data)
-                logger.error(f"✅ Network response captured: {response_data.get('status')} {response_data.get('url')}")
+                slot = self._req_ring[self._req_head]
+                slot.clear()
+                slot['requestId'] = message.get('requestId')
+                slot['url'] = req.get('url')
+                slot['method'] = req.get('method')
+                slot['headers'] = req.get('headers', {})
+                slot['timestamp'] = message.get('timestamp')
+                slot['type'] = message.get('type')
+                slot['postData'] = req.get('postData')
+                self._req_head = (self._req_head + 1) % self.max_network_entries
+                if self._req_count < self.max_network_entries:
+                    self._req_count += 1
+            logger.debug("✅ Network request captured: %s %s", req.get('method'), req.get('url'))
+        except Exception as e:
+            logger.error(f"Error handling network request: {e}")
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running event loop, caching it on first use."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def _signal_api_response(self, url_lc: str):
+        """Wake any assessment waiting on API/GraphQL traffic (threadsafe)."""
+        if (self._graphql_ready is not None and self._loop is not None
+                and ('/api/' in url_lc or 'graphql' in url_lc)):
+            self._loop.call_soon_threadsafe(self._graphql_ready.set)
+
+    def _parse_response_message(self, message):
+        """Sniff the response message schema once and install the matching parser."""
+        if isinstance(message, dict) and 'params' in message:
+            self._parse_response_message = self._parse_response_cdp
+        else:
+            self._parse_response_message = self._parse_response_direct
+        self._parse_response_message(message)
+
+    def _parse_response_cdp(self, message):
+        """Parse a standard CDP format Network.responseReceived message."""
+        try:
+            # Debug: Log to stderr only for MCP compatibility
+            logger.debug("CDP Network Response Event: %s", message)
+
+            params = message['params']
+            # Bind the nested dict once instead of building a throwaway {}
+            # per missing field on every event
+            resp = params.get('response') or {}
+            # Case-fold the URL once at capture time so filtering doesn't
+            # re-lower every stored URL on every get_network_responses call
+            url_lc = (resp.get('url') or '').lower()
+
+            # Overwrite the next ring slot in place - no per-event dict
+            with self.network_lock:
+                slot = self._resp_ring[self._resp_head]
+                slot.clear()
+                slot['requestId'] = params.get('requestId')
+                slot['url'] = resp.get('url')
+                slot['status'] = resp.get('status')
+                slot['statusText'] = resp.get('statusText')
+                slot['headers'] = resp.get('headers', {})
+                slot['mimeType'] = resp.get('mimeType')
+                slot['timestamp'] = params.get('timestamp')
+                slot['type'] = params.get('type')
+                slot['_url_lc'] = url_lc
+                self._resp_head = (self._resp_head + 1) % self.max_network_entries
+                if self._resp_count < self.max_network_entries:
+                    self._resp_count += 1
+            self._signal_api_response(url_lc)
+            logger.debug("✅ Network response captured: %s %s", resp.get('status'), resp.get('url'))
+        except Exception as e:
+            logger.error(f"Error handling network response: {e}")
+
+    def _parse_response_direct(self, message):
+        """Parse a direct format (undetected-chromedriver specific) response message."""
+        try:
+            # Debug: Log to stderr only for MCP compatibility
+            logger.debug("CDP Network Response Event: %s", message)
+
+            # Bind the nested dict once; fall back to top-level fields when
+            # the message carries no 'response' payload
+            resp = message.get('response') or message
+            # Case-fold the URL once at capture time so filtering doesn't
+            # re-lower every stored URL on every get_network_responses call
+            url_lc = (resp.get('url') or '').lower()
+
+            # Overwrite the next ring slot in place - no per-event dict
+            with self.network_lock:
+                slot = self._resp_ring[self._resp_head]
+                slot.clear()
+                slot['requestId'] = message.get('requestId')
+                slot['url'] = resp.get('url')
+                slot['status'] = resp.get('status')
+                slot['statusText'] = resp.get('statusText')
+                slot['headers'] = resp.get('headers', {})
+                slot['mimeType'] = resp.get('mimeType')
+                slot['timestamp'] = message.get('timestamp')
+                slot['type'] = message.get('type')
+                slot['_url_lc'] = url_lc
+                self._resp_head = (self._resp_head + 1) % self.max_network_entries
+                if self._resp_count < self.max_network_entries:
+                    self._resp_count += 1
+            self._signal_api_response(url_lc)
+            logger.debug("✅ Network response captured: %s %s", resp.get('status'), resp.get('url'))
         except Exception as e:
             logger.error(f"Error handling network response: {e}")
     
@@ -114,13 +288,35 @@ class EnhancedChromeClient(ChromeClient):
         
         try:
             driver = self._get_chrome_driver()
-            
-            # Enable Network domain (direct synchronous call)
-            driver.execute_cdp_cmd('Network.enable', {})
-            
-            # Add event listeners (direct synchronous calls)
-            driver.add_cdp_listener('Network.requestWillBeSent', self._network_request_handler)
-            driver.add_cdp_listener('Network.responseReceived', self._network_response_handler)
+
+            # Start the drain thread that parses queued CDP messages
+            if self._drain_thread is None or not self._drain_thread.is_alive():
+                self._drain_thread = threading.Thread(
+                    target=self._drain_network_events,
+                    name="cdp-drain",
+                    daemon=True
+                )
+                self._drain_thread.start()
+
+            # Readiness event the response parser sets (threadsafe) once
+            # API/GraphQL traffic has been captured
+            loop = self._get_loop()
+            self._graphql_ready = asyncio.Event()
+
+            # Enable Network domain and add listeners on the CDP pool so the
+            # blocking DevTools calls stay off the event loop
+            await loop.run_in_executor(
+                self._cdp_executor,
+                lambda: driver.execute_cdp_cmd('Network.enable', {})
+            )
+            await loop.run_in_executor(
+                self._cdp_executor,
+                lambda: driver.add_cdp_listener('Network.requestWillBeSent', self._network_request_handler)
+            )
+            await loop.run_in_executor(
+                self._cdp_executor,
+                lambda: driver.add_cdp_listener('Network.responseReceived', self._network_response_handler)
+            )
             
             self.network_monitoring = True
             logger.info("Network monitoring started successfully")
@@ -137,9 +333,20 @@ class EnhancedChromeClient(ChromeClient):
         
         try:
             if self.driver:
-                # Disable Network domain (direct synchronous call)
-                self.driver.execute_cdp_cmd('Network.disable', {})
-            
+                # Disable Network domain on the CDP pool
+                driver = self.driver
+                await self._get_loop().run_in_executor(
+                    self._cdp_executor,
+                    lambda: driver.execute_cdp_cmd('Network.disable', {})
+                )
+
+            # Stop the drain thread via sentinel after any queued events
+            if self._drain_thread and self._drain_thread.is_alive():
+                self._raw_req_queue.append(_DRAIN_STOP)
+                self._drain_event.set()
+                self._drain_thread.join(timeout=2)
+            self._drain_thread = None
+
             self.network_monitoring = False
             logger.info("Network monitoring stopped")
             return True
@@ -148,30 +355,58 @@ class EnhancedChromeClient(ChromeClient):
             logger.error(f"Failed to stop network monitoring: {e}")
             return False
     
-    def get_network_responses(self, url_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get captured network responses, optionally filtered by URL pattern."""
+    def _ring_snapshot(self, ring: List[Dict[str, Any]], head: int, count: int) -> List[Dict[str, Any]]:
+        """Copy the live ring entries, newest first (caller holds network_lock).
+
+        Slots are reused in place by the capture path, so callers get dict
+        copies rather than references into the ring.
+        """
+        n = self.max_network_entries
+        return [dict(ring[(head - 1 - i) % n]) for i in range(count)]
+
+    def get_network_responses(self, url_filter: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
+        """Get a read-only snapshot of captured responses, optionally filtered by URL pattern."""
         with self.network_lock:
-            if url_filter:
-                return [resp for resp in self.network_responses if url_filter.lower() in resp.get('url', '').lower()]
-            return self.network_responses.copy()
-    
-    def get_network_requests(self, url_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get captured network requests, optionally filtered by URL pattern."""
+            entries = self._ring_snapshot(self._resp_ring, self._resp_head, self._resp_count)
+        if url_filter:
+            needle = url_filter.lower()
+            return tuple(resp for resp in entries if needle in resp['_url_lc'])
+        return tuple(entries)
+
+    def get_network_requests(self, url_filter: Optional[str] = None) -> Tuple[Dict[str, Any], ...]:
+        """Get a read-only snapshot of captured requests, optionally filtered by URL pattern."""
         with self.network_lock:
-            if url_filter:
-                return [req for req in self.network_requests if url_filter.lower() in req.get('url', '').lower()]
-            return self.network_requests.copy()
+            entries = self._ring_snapshot(self._req_ring, self._req_head, self._req_count)
+        if url_filter:
+            needle = url_filter.lower()
+            return tuple(req for req in entries if needle in (req.get('url') or '').lower())
+        return tuple(entries)
     
     async def get_response_body(self, request_id: str) -> Optional[str]:
         """Get response body for a specific request ID."""
         if not self.network_monitoring:
             logger.warning("Network monitoring is not enabled")
             return None
-        
+
+        # Serve repeat fetches from the cache instead of re-asking Chrome
+        cached = self._body_cache.get(request_id)
+        if cached is not None:
+            self._body_cache.move_to_end(request_id)
+            return cached
+
         try:
             if self.driver:
-                result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
-                return result.get('body')
+                driver = self.driver
+                result = await self._get_loop().run_in_executor(
+                    self._cdp_executor,
+                    lambda: driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                )
+                body = result.get('body')
+                if body is not None:
+                    self._body_cache[request_id] = body
+                    if len(self._body_cache) > self._body_cache_max:
+                        self._body_cache.popitem(last=False)
+                return body
         except Exception as e:
             logger.warning(f"Failed to get response body for request {request_id}: {e}")
             return None
@@ -179,8 +414,15 @@ class EnhancedChromeClient(ChromeClient):
     def clear_network_data(self):
         """Clear all captured network data."""
         with self.network_lock:
-            self.network_requests.clear()
-            self.network_responses.clear()
+            # Resetting the indices retires every live entry; the
+            # preallocated slots themselves stay around for reuse
+            self._req_head = 0
+            self._req_count = 0
+            self._resp_head = 0
+            self._resp_count = 0
+        self._body_cache.clear()
+        if self._graphql_ready is not None:
+            self._graphql_ready.clear()
         logger.info("Network data cleared")
     
     async def assess_api_enhanced(self, api_url: str) -> Dict[str, Any]:
@@ -222,9 +464,24 @@ class EnhancedChromeClient(ChromeClient):
                 enhanced_data['endpoints'] = endpoints
                 logger.error(f"🔄 Extracted {len(endpoints)} detailed endpoints")
             
+            # Enrich from captured network payloads when monitoring is active
+            if self.network_monitoring:
+                # Wait for API/GraphQL traffic to be captured instead of a
+                # fixed sleep; the response parser signals readiness and the
+                # timeout bounds the wait when the page produces none
+                if self._graphql_ready is not None and not self._graphql_ready.is_set():
+                    try:
+                        await asyncio.wait_for(self._graphql_ready.wait(), timeout=3)
+                    except asyncio.TimeoutError:
+                        logger.error("🔄 Timed out waiting for API/GraphQL responses")
+
+                network_data = await self._extract_network_data()
+                for key, value in network_data.items():
+                    if value and key not in enhanced_data:
+                        enhanced_data[key] = value
+
             # Extract provider from URL structure (real extraction) as fallback
             if 'provider' not in enhanced_data and 'rapidapi.com/' in api_url and '/api/' in api_url:
-                import re
                 provider_match = re.search(r'rapidapi\.com/([^/]+)/api/', api_url)
                 if provider_match:
                     enhanced_data['provider'] = provider_match.group(1)
@@ -252,8 +509,7 @@ class EnhancedChromeClient(ChromeClient):
     async def _extract_dom_data(self) -> Dict[str, Any]:
         """Extract API data directly from DOM after JavaScript rendering."""
         enhanced_data = {}
-        import re
-        
+
         try:
             if not self.driver:
                 logger.warning("No Chrome driver available for DOM extraction")
@@ -511,84 +767,215 @@ class EnhancedChromeClient(ChromeClient):
         
         return enhanced_data
 
-    async def _extract_graphql_data(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract API data from real GraphQL responses."""
+    @staticmethod
+    def _classify_response(response):
+        """Tag a captured response as 'graphql' or 'rsc', or None to skip it."""
+        url_lc = response.get('_url_lc', '')
+        if 'graphql' in url_lc:
+            return 'graphql'
+        if '/api/' in url_lc:
+            return 'rsc'
+        return None
+
+    @staticmethod
+    def _fetch_priority(tagged_response):
+        """Sort key putting responses likely to carry the full API record first."""
+        url_lc = tagged_response[1].get('_url_lc', '')
+        return 0 if ('marketplace' in url_lc or 'getapi' in url_lc) else 1
+
+    @staticmethod
+    def _extraction_complete(rsc_data, graphql_data):
+        """True once the combined data covers the fields assessments need."""
+        merged = graphql_data.keys() | rsc_data.keys()
+        return ('name' in merged and 'description' in merged
+                and ('pricing' in merged or 'endpoints' in merged))
+
+    async def _extract_network_data(self):
+        """Extract API data from captured responses in a single pass.
+
+        One scan over the buffer tags each response as RSC or GraphQL; body
+        fetches are issued concurrently (bounded by a semaphore) as tasks,
+        and each body is routed to the matching parser. Parsing stops - and
+        the remaining fetches are cancelled - as soon as the combined data
+        is complete.
+        """
         enhanced_data = {}
-        
+
         try:
-            for response in responses:
-                request_id = response.get('requestId')
-                if request_id:
-                    # Get actual response body
-                    body = await self.get_response_body(request_id)
-                    
-                    if body:
-                        try:
-                            # Parse actual JSON response
-                            response_data = json.loads(body)
-                            
-                            # Extract real API information from GraphQL structure
-                            if 'data' in response_data:
-                                data = response_data['data']
-                                
-                                # Look for API information in various GraphQL response structures
-                                api_info = None
-                                if 'api' in data:
-                                    api_info = data['api']
-                                elif 'getApi' in data:
-                                    api_info = data['getApi']
-                                elif 'apiDetails' in data:
-                                    api_info = data['apiDetails']
-                                elif 'marketplace' in data and 'api' in data['marketplace']:
-                                    api_info = data['marketplace']['api']
-                                
-                                if api_info:
-                                    # Extract real fields from GraphQL response
-                                    if api_info.get('name'):
-                                        enhanced_data['name'] = api_info['name']
-                                    if api_info.get('description'):
-                                        enhanced_data['description'] = api_info['description']
-                                    if api_info.get('provider') or api_info.get('providerName'):
-                                        enhanced_data['provider'] = api_info.get('provider') or api_info.get('providerName')
-                                    if api_info.get('rating') is not None:
-                                        enhanced_data['rating'] = float(api_info['rating'])
-                                    if api_info.get('reviewCount') is not None:
-                                        enhanced_data['reviewCount'] = int(api_info['reviewCount'])
-                                    if api_info.get('popularity'):
-                                        enhanced_data['popularity'] = api_info['popularity']
-                                    if api_info.get('serviceLevel'):
-                                        enhanced_data['serviceLevel'] = api_info['serviceLevel']
-                                    if api_info.get('documentationUrl'):
-                                        enhanced_data['documentationUrl'] = api_info['documentationUrl']
-                                    
-                                    # Extract pricing information
-                                    if 'pricing' in api_info and api_info['pricing']:
-                                        enhanced_data['pricing'] = api_info['pricing']
-                                    elif 'pricingTiers' in api_info:
-                                        enhanced_data['pricing'] = {'tiers': api_info['pricingTiers']}
-                                    elif 'plans' in api_info:
-                                        enhanced_data['pricing'] = {'tiers': api_info['plans']}
-                                    
-                                    # Extract endpoints with parameters
-                                    if 'endpoints' in api_info and api_info['endpoints']:
-                                        enhanced_data['endpoints'] = api_info['endpoints']
-                                    elif 'methods' in api_info:
-                                        enhanced_data['endpoints'] = api_info['methods']
-                                    elif 'operations' in api_info:
-                                        enhanced_data['endpoints'] = api_info['operations']
-                                    
-                                    logger.info(f"Extracted real GraphQL data: {list(enhanced_data.keys())}")
-                                    break
-                                    
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Could not parse JSON from response {request_id}: {e}")
-                            continue
-                            
+            tagged = [(tag, response) for response in self.get_network_responses()
+                      if (tag := self._classify_response(response)) is not None]
+            if not tagged:
+                return enhanced_data
+
+            # Most promising responses first so the early-out below fires
+            # before the long tail of bodies is even consumed
+            tagged.sort(key=self._fetch_priority)
+
+            # Each get_response_body call is a round-trip to Chrome; issuing
+            # them as tasks turns N sequential waits into one, with the
+            # semaphore capping in-flight calls on the CDP channel
+            semaphore = asyncio.Semaphore(16)
+
+            async def fetch(request_id):
+                if not request_id:
+                    return None
+                async with semaphore:
+                    return await self.get_response_body(request_id)
+
+            tasks = [asyncio.ensure_future(fetch(response.get('requestId')))
+                     for _, response in tagged]
+
+            rsc_data = {}
+            graphql_data = {}
+            try:
+                for (tag, response), task in zip(tagged, tasks):
+                    try:
+                        body = await task
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch body for {response.get('requestId')}: {e}")
+                        continue
+                    if not body:
+                        continue
+                    if tag == 'graphql':
+                        # First successful GraphQL payload wins, as before
+                        if not graphql_data:
+                            self._parse_graphql_body(response, body, graphql_data)
+                    else:
+                        self._parse_rsc_body(response, body, rsc_data)
+
+                    if self._extraction_complete(rsc_data, graphql_data):
+                        break
+            finally:
+                # Don't pay for bodies the early-out made irrelevant
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+
+            # RSC fields take precedence over GraphQL ones, matching the
+            # previous merge order of the separate extractors
+            enhanced_data.update(graphql_data)
+            enhanced_data.update(rsc_data)
+
+            if enhanced_data:
+                logger.info(f"Extracted network data: {list(enhanced_data.keys())}")
+
         except Exception as e:
-            logger.error(f"Error extracting GraphQL data: {e}")
-        
+            logger.error(f"Error extracting network data: {e}")
+
         return enhanced_data
 
+    def _parse_rsc_body(self, response, body, enhanced_data):
+        """Parse one React Server Component payload into enhanced_data."""
+        # Skip bodies that can't contain any of the markers below before
+        # running the extraction patterns over them
+        if ('"description"' not in body and '"plans"' not in body
+                and '"endpoints"' not in body):
+            return
+
+        # Description embedded in the page's meta content - it sits near
+        # the head of the payload, so cap the scan at 64KB rather than
+        # running the pattern over hundreds of KB
+        if 'description' not in enhanced_data:
+            desc_match = _DESC_RE.search(body[:65536])
+            if desc_match and len(desc_match.group(1)) >= 50:
+                enhanced_data['description'] = desc_match.group(1)
+
+        # Provider from the response URL path - the pattern is trivial
+        # enough that a pair of str.find calls beats the regex engine
+        if 'provider' not in enhanced_data:
+            url = response.get('url') or ''
+            i = url.find('rapidapi.com/')
+            if i >= 0:
+                start = i + len('rapidapi.com/')
+                end = url.find('/', start)
+                if end > start:
+                    enhanced_data['provider'] = url[start:end]
+
+        # Pricing plans serialized into the RSC payload
+        if 'pricing' not in enhanced_data:
+            plans = _extract_json_after(body, 'plans')
+            if plans is not None:
+                enhanced_data['pricing'] = {'tiers': plans}
+
+        # Endpoint list serialized into the RSC payload
+        if 'endpoints' not in enhanced_data:
+            endpoints = _extract_json_after(body, 'endpoints')
+            if endpoints is not None:
+                enhanced_data['endpoints'] = endpoints
+
+    def _parse_graphql_body(self, response, body, enhanced_data):
+        """Parse one GraphQL response body into enhanced_data."""
+        # Cheap sniff: skip HTML/JS/RSC bodies before invoking the JSON
+        # parser on a potentially large payload
+        stripped = body.lstrip()
+        if not stripped or stripped[0] not in '{[':
+            return
+        if '"data"' not in body:
+            return
+
+        try:
+            # Parse actual JSON response
+            response_data = _loads(body)
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
+            logger.warning(f"Could not parse JSON from response {response.get('requestId')}: {e}")
+            return
+
+        # Extract real API information from GraphQL structure
+        if 'data' not in response_data:
+            return
+        data = response_data['data']
+
+        # Look for API information in various GraphQL response structures
+        api_info = None
+        if 'api' in data:
+            api_info = data['api']
+        elif 'getApi' in data:
+            api_info = data['getApi']
+        elif 'apiDetails' in data:
+            api_info = data['apiDetails']
+        elif 'marketplace' in data and 'api' in data['marketplace']:
+            api_info = data['marketplace']['api']
+
+        if not api_info:
+            return
+
+        # Extract real fields from GraphQL response
+        if api_info.get('name'):
+            enhanced_data['name'] = api_info['name']
+        if api_info.get('description'):
+            enhanced_data['description'] = api_info['description']
+        if api_info.get('provider') or api_info.get('providerName'):
+            enhanced_data['provider'] = api_info.get('provider') or api_info.get('providerName')
+        if api_info.get('rating') is not None:
+            enhanced_data['rating'] = float(api_info['rating'])
+        if api_info.get('reviewCount') is not None:
+            enhanced_data['reviewCount'] = int(api_info['reviewCount'])
+        if api_info.get('popularity'):
+            enhanced_data['popularity'] = api_info['popularity']
+        if api_info.get('serviceLevel'):
+            enhanced_data['serviceLevel'] = api_info['serviceLevel']
+        if api_info.get('documentationUrl'):
+            enhanced_data['documentationUrl'] = api_info['documentationUrl']
+
+        # Extract pricing information
+        if 'pricing' in api_info and api_info['pricing']:
+            enhanced_data['pricing'] = api_info['pricing']
+        elif 'pricingTiers' in api_info:
+            enhanced_data['pricing'] = {'tiers': api_info['pricingTiers']}
+        elif 'plans' in api_info:
+            enhanced_data['pricing'] = {'tiers': api_info['plans']}
+
+        # Extract endpoints with parameters
+        if 'endpoints' in api_info and api_info['endpoints']:
+            enhanced_data['endpoints'] = api_info['endpoints']
+        elif 'methods' in api_info:
+            enhanced_data['endpoints'] = api_info['methods']
+        elif 'operations' in api_info:
+            enhanced_data['endpoints'] = api_info['operations']
+
+        logger.info(f"Extracted real GraphQL data: {list(enhanced_data.keys())}")
+
     async def _navigate_to_page(self, api_url: str):
         """Navigate to the API page using exact undetected-chrome MCP code."""
         import time
@@ -601,21 +988,26 @@ class EnhancedChromeClient(ChromeClient):
         try:
             if not self.driver:
                 self.driver = self._get_chrome_driver()
-            
+            driver = self.driver
+
             # Set page load timeout (copied from undetected-chrome MCP)
             timeout = 30  # seconds
-            self.driver.set_page_load_timeout(timeout)
-            
-            # Navigate to URL (exact same as undetected-chrome MCP)
-            self.driver.get(api_url)
-            
-            # Add human-like delay (copied from undetected-chrome MCP)
+            driver.set_page_load_timeout(timeout)
+
+            # Navigate on the CDP pool - driver.get blocks for the full page
+            # load, and running it on the loop thread would stall the CDP
+            # callbacks we depend on for network capture
+            await self._get_loop().run_in_executor(
+                self._cdp_executor, driver.get, api_url
+            )
+
+            # Add human-like delay without blocking the event loop
             delay = random.uniform(0.5, 1.5)
-            time.sleep(delay)
-            
+            await asyncio.sleep(delay)
+
             # Get final URL and title (same as undetected-chrome MCP)
-            final_url = self.driver.current_url
-            title = self.driver.title
+            final_url = driver.current_url
+            title = driver.title
             
             load_time = int((time.time() - start_time) * 1000)  # Convert to milliseconds
             
@@ -701,10 +1093,14 @@ class EnhancedChromeClient(ChromeClient):
             
             # Set script timeout (copied from undetected-chrome MCP)
             timeout = 30  # seconds
-            self.driver.set_script_timeout(timeout)
-            
-            # Execute the script (exact same as undetected-chrome MCP)
-            result = self.driver.execute_script(script)
+            driver = self.driver
+            driver.set_script_timeout(timeout)
+
+            # Execute the script on the CDP pool so the blocking Selenium
+            # call doesn't stall the event loop
+            result = await self._get_loop().run_in_executor(
+                self._cdp_executor, driver.execute_script, script
+            )
             
             # Process the result (copied from undetected-chrome MCP result processing)
             if result is None:
@@ -780,10 +1176,14 @@ class EnhancedChromeClient(ChromeClient):
             
             # Set script timeout (copied from undetected-chrome MCP)
             timeout = 30  # seconds
-            self.driver.set_script_timeout(timeout)
-            
-            # Execute the script (exact same as undetected-chrome MCP)
-            result = self.driver.execute_script(script)
+            driver = self.driver
+            driver.set_script_timeout(timeout)
+
+            # Execute the script on the CDP pool so the blocking Selenium
+            # call doesn't stall the event loop
+            result = await self._get_loop().run_in_executor(
+                self._cdp_executor, driver.execute_script, script
+            )
             
             # Process the result (copied from undetected-chrome MCP result processing)
             if result is None:
@@ -871,10 +1271,14 @@ class EnhancedChromeClient(ChromeClient):
             
             # Set script timeout (copied from undetected-chrome MCP)
             timeout = 30  # seconds
-            self.driver.set_script_timeout(timeout)
-            
-            # Execute the script (exact same as undetected-chrome MCP)
-            result = self.driver.execute_script(script)
+            driver = self.driver
+            driver.set_script_timeout(timeout)
+
+            # Execute the script on the CDP pool so the blocking Selenium
+            # call doesn't stall the event loop
+            result = await self._get_loop().run_in_executor(
+                self._cdp_executor, driver.execute_script, script
+            )
             
             # Process the result (copied from undetected-chrome MCP result processing)
             if result is None:
@@ -910,18 +1314,20 @@ class EnhancedChromeClient(ChromeClient):
     async def _scrape_endpoint_sections(self) -> list:
         """Extract detailed endpoint sections by expanding all collapsed sections first."""
         logger.error("🔥 DEBUG: _scrape_endpoint_sections called - EXPAND ALL SECTIONS VERSION")
-        
-        
+
+
         # Wait for page load and then expand sections
-        import time
-        time.sleep(3)
-        
+        await asyncio.sleep(3)
+
         try:
             from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
-            
+
             if not self.driver:
                 logger.error("🔄 No Chrome driver available for endpoint section scraping")
                 return []
+
+            driver = self.driver
+            loop = self._get_loop()
             
             # First, find all sections and expand them one by one with delays
             find_sections_script = '''
@@ -951,7 +1357,9 @@ class EnhancedChromeClient(ChromeClient):
             return sections;
             '''
             
-            sections = self.driver.execute_script(find_sections_script)
+            sections = await loop.run_in_executor(
+                self._cdp_executor, driver.execute_script, find_sections_script
+            )
             logger.error(f"🔄 Found {len(sections)} sections: {sections}")
             
             # Now expand each closed section individually with delays
@@ -968,11 +1376,13 @@ class EnhancedChromeClient(ChromeClient):
                         }}
                         return false;
                         '''
-                        clicked = self.driver.execute_script(click_script)
+                        clicked = await loop.run_in_executor(
+                            self._cdp_executor, driver.execute_script, click_script
+                        )
                         if clicked:
                             expand_actions.append({'name': section['name'], 'action': 'clicked'})
                             logger.error(f"🔄 Clicked to expand: {section['name']}")
-                            time.sleep(0.5)  # Human-like delay between clicks
+                            await asyncio.sleep(0.5)  # Human-like delay between clicks
                         else:
                             expand_actions.append({'name': section['name'], 'action': 'failed_to_click'})
                     except Exception as e:
@@ -984,7 +1394,7 @@ class EnhancedChromeClient(ChromeClient):
             logger.error(f"🔄 Section expansion result: {expand_actions}")
             
             # Wait for all sections to fully expand
-            time.sleep(3)
+            await asyncio.sleep(3)
             
             # Now extract endpoints from all sections
             extract_script = '''
@@ -1037,7 +1447,9 @@ class EnhancedChromeClient(ChromeClient):
             '''
             
             # Extract all endpoints from now-expanded sections
-            result = self.driver.execute_script(extract_script)
+            result = await loop.run_in_executor(
+                self._cdp_executor, driver.execute_script, extract_script
+            )
             
             # Process the result
             if result is None or not isinstance(result, list):
@@ -1228,6 +1640,9 @@ class EnhancedChromeClient(ChromeClient):
         # Stop network monitoring if active
         if self.network_monitoring:
             await self.stop_network_monitoring()
-            
+
+        # Release the CDP offload pool
+        self._cdp_executor.shutdown(wait=False)
+
         # Call parent close
         await super().close()
\ No newline at end of file